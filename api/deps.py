@@ -0,0 +1,40 @@
+import inspect
+
+from fastapi import Depends, HTTPException
+from sqlalchemy import bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.database import get_db
+
+
+def get_or_404(model, param: str, detail: str):
+    """
+    Build a dependency that loads a row by primary key or raises a 404.
+
+    The SELECT is constructed once per dependency at import time, so every
+    get/update/delete endpoint shares one cached statement and one place
+    that raises the not-found error.
+
+    Args:
+        model: SQLAlchemy model class to load.
+        param: Name of the path parameter holding the id.
+        detail: Message for the 404 response.
+    """
+    stmt = select(model).where(model.id == bindparam("obj_id"))
+
+    async def _dep(**kwargs):
+        db: AsyncSession = kwargs["db"]
+        obj = (await db.execute(stmt, {"obj_id": kwargs[param]})).scalar_one_or_none()
+        if obj is None:
+            raise HTTPException(status_code=404, detail=detail)
+        return obj
+
+    # FastAPI reads the path-parameter name from the signature, so build
+    # it dynamically around the configured param
+    _dep.__signature__ = inspect.Signature([
+        inspect.Parameter(param, inspect.Parameter.KEYWORD_ONLY, annotation=int),
+        inspect.Parameter("db", inspect.Parameter.KEYWORD_ONLY,
+                          annotation=AsyncSession, default=Depends(get_db)),
+    ])
+    _dep.__name__ = f"get_{model.__name__.lower()}_or_404"
+    return _dep
@@ -1,14 +1,19 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.deps import get_or_404
 from database.database import get_db
 from database.models import (
-    Diagnosis as DiagnosisModel, 
+    Diagnosis as DiagnosisModel,
     CPTCode as CPTCodeModel,
     PatientDiagnosis as PatientDiagnosisModel,
     PatientProcedure as PatientProcedureModel
 )
+from services import cache
+from utils.http_cache import etag_cache
 from models.medical import (
     Diagnosis, DiagnosisCreate,
     CPTCode, CPTCodeCreate,
@@ -20,221 +25,228 @@ router = APIRouter(
     prefix="/medical",
     tags=["medical"],
     responses={404: {"description": "Not found"}},
+    default_response_class=ORJSONResponse,
 )
 
 
+# Shared load-or-404 dependencies; each underlying SELECT is built once
+get_diagnosis_or_404 = get_or_404(DiagnosisModel, "diagnosis_id", "Diagnosis not found")
+get_cpt_code_or_404 = get_or_404(CPTCodeModel, "cpt_code_id", "CPT code not found")
+get_patient_diagnosis_or_404 = get_or_404(
+    PatientDiagnosisModel, "patient_diagnosis_id", "Patient diagnosis not found")
+get_patient_procedure_or_404 = get_or_404(
+    PatientProcedureModel, "patient_procedure_id", "Patient procedure not found")
+
+
 # Diagnoses endpoints
 @router.post("/diagnoses/", response_model=Diagnosis)
-def create_diagnosis(diagnosis: DiagnosisCreate, db: Session = Depends(get_db)):
+async def create_diagnosis(diagnosis: DiagnosisCreate, db: AsyncSession = Depends(get_db)):
     """
     Create a new diagnosis.
     """
-    db_diagnosis = DiagnosisModel(
-        icd_code=diagnosis.icd_code,
-        description=diagnosis.description,
-        severity=diagnosis.severity
-    )
-    db.add(db_diagnosis)
-    db.commit()
-    db.refresh(db_diagnosis)
+    # INSERT ... RETURNING gives back the persisted row in one round-trip,
+    # avoiding the extra SELECT a refresh() would issue
+    db_diagnosis = (await db.execute(
+        insert(DiagnosisModel).values(**diagnosis.model_dump()).returning(DiagnosisModel)
+    )).scalar_one()
+    await db.commit()
     return db_diagnosis
 
 
 @router.get("/diagnoses/", response_model=List[Diagnosis])
-def read_diagnoses(
-    skip: int = 0, 
-    limit: int = 100, 
+@etag_cache(ttl=60)
+async def read_diagnoses(
+    skip: int = 0,
+    limit: int = 100,
     icd_code: Optional[str] = Query(None, description="Filter by ICD-10 code"),
     severity: Optional[int] = Query(None, description="Filter by severity level"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Retrieve diagnoses with optional filtering.
     """
-    query = db.query(DiagnosisModel)
-    
+    # Select plain column rows — the list path never mutates these
+    # objects, so skip ORM instrumentation entirely
+    query = select(DiagnosisModel.__table__)
+
     if icd_code:
-        query = query.filter(DiagnosisModel.icd_code.ilike(f"%{icd_code}%"))
-    
+        query = query.where(DiagnosisModel.icd_code.ilike(f"%{icd_code}%"))
+
     if severity is not None:
-        query = query.filter(DiagnosisModel.severity == severity)
-    
-    diagnoses = query.offset(skip).limit(limit).all()
-    return diagnoses
+        query = query.where(DiagnosisModel.severity == severity)
+
+    rows = (await db.execute(query.offset(skip).limit(limit))).mappings().all()
+    # model_construct skips re-validation; the rows come straight from our
+    # own schema and already have the right types
+    return [Diagnosis.model_construct(**row) for row in rows]
 
 
 @router.get("/diagnoses/{diagnosis_id}", response_model=Diagnosis)
-def read_diagnosis(diagnosis_id: int, db: Session = Depends(get_db)):
+async def read_diagnosis(diagnosis: DiagnosisModel = Depends(get_diagnosis_or_404)):
     """
     Retrieve a specific diagnosis by ID.
     """
-    diagnosis = db.query(DiagnosisModel).filter(DiagnosisModel.id == diagnosis_id).first()
-    if diagnosis is None:
-        raise HTTPException(status_code=404, detail="Diagnosis not found")
     return diagnosis
 
 
 # CPT Codes endpoints
 @router.post("/cpt-codes/", response_model=CPTCode)
-def create_cpt_code(cpt_code: CPTCodeCreate, db: Session = Depends(get_db)):
+async def create_cpt_code(cpt_code: CPTCodeCreate, db: AsyncSession = Depends(get_db)):
     """
     Create a new CPT code.
     """
-    db_cpt_code = CPTCodeModel(
-        code=cpt_code.code,
-        description=cpt_code.description,
-        duration_minutes=cpt_code.duration_minutes,
-        requires_specialist=cpt_code.requires_specialist
-    )
-    db.add(db_cpt_code)
-    db.commit()
-    db.refresh(db_cpt_code)
+    db_cpt_code = (await db.execute(
+        insert(CPTCodeModel).values(**cpt_code.model_dump()).returning(CPTCodeModel)
+    )).scalar_one()
+    await db.commit()
+    cache.invalidate("cpt_codes")
     return db_cpt_code
 
 
 @router.get("/cpt-codes/", response_model=List[CPTCode])
-def read_cpt_codes(
-    skip: int = 0, 
-    limit: int = 100, 
+@etag_cache(ttl=60)
+async def read_cpt_codes(
+    skip: int = 0,
+    limit: int = 100,
     code: Optional[str] = Query(None, description="Filter by CPT code"),
     requires_specialist: Optional[bool] = Query(None, description="Filter by specialist requirement"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Retrieve CPT codes with optional filtering.
     """
-    query = db.query(CPTCodeModel)
-    
+    # Select plain column rows — the list path never mutates these
+    # objects, so skip ORM instrumentation entirely
+    query = select(CPTCodeModel.__table__)
+
     if code:
-        query = query.filter(CPTCodeModel.code.ilike(f"%{code}%"))
-    
+        query = query.where(CPTCodeModel.code.ilike(f"%{code}%"))
+
     if requires_specialist is not None:
-        query = query.filter(CPTCodeModel.requires_specialist == requires_specialist)
-    
-    cpt_codes = query.offset(skip).limit(limit).all()
-    return cpt_codes
+        query = query.where(CPTCodeModel.requires_specialist == requires_specialist)
+
+    rows = (await db.execute(query.offset(skip).limit(limit))).mappings().all()
+    # model_construct skips re-validation; the rows come straight from our
+    # own schema and already have the right types
+    return [CPTCode.model_construct(**row) for row in rows]
 
 
 @router.get("/cpt-codes/{cpt_code_id}", response_model=CPTCode)
-def read_cpt_code(cpt_code_id: int, db: Session = Depends(get_db)):
+async def read_cpt_code(cpt_code: CPTCodeModel = Depends(get_cpt_code_or_404)):
     """
     Retrieve a specific CPT code by ID.
     """
-    cpt_code = db.query(CPTCodeModel).filter(CPTCodeModel.id == cpt_code_id).first()
-    if cpt_code is None:
-        raise HTTPException(status_code=404, detail="CPT code not found")
     return cpt_code
 
 
 # Patient Diagnoses endpoints
 @router.post("/patient-diagnoses/", response_model=PatientDiagnosis)
-def create_patient_diagnosis(patient_diagnosis: PatientDiagnosisCreate, db: Session = Depends(get_db)):
+async def create_patient_diagnosis(patient_diagnosis: PatientDiagnosisCreate, db: AsyncSession = Depends(get_db)):
     """
     Create a new patient diagnosis.
     """
-    db_patient_diagnosis = PatientDiagnosisModel(
-        patient_id=patient_diagnosis.patient_id,
-        diagnosis_id=patient_diagnosis.diagnosis_id,
-        diagnosed_date=patient_diagnosis.diagnosed_date,
-        notes=patient_diagnosis.notes
-    )
-    db.add(db_patient_diagnosis)
-    db.commit()
-    db.refresh(db_patient_diagnosis)
+    db_patient_diagnosis = (await db.execute(
+        insert(PatientDiagnosisModel)
+        .values(**patient_diagnosis.model_dump())
+        .returning(PatientDiagnosisModel)
+    )).scalar_one()
+    await db.commit()
     return db_patient_diagnosis
 
 
 @router.get("/patient-diagnoses/", response_model=List[PatientDiagnosis])
-def read_patient_diagnoses(
-    skip: int = 0, 
-    limit: int = 100, 
+async def read_patient_diagnoses(
+    skip: int = 0,
+    limit: int = 100,
     patient_id: Optional[int] = Query(None, description="Filter by patient ID"),
     diagnosis_id: Optional[int] = Query(None, description="Filter by diagnosis ID"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Retrieve patient diagnoses with optional filtering.
     """
-    query = db.query(PatientDiagnosisModel)
-    
+    # Select plain column rows — the list path never mutates these
+    # objects, so skip ORM instrumentation entirely
+    query = select(PatientDiagnosisModel.__table__)
+
     if patient_id is not None:
-        query = query.filter(PatientDiagnosisModel.patient_id == patient_id)
-    
+        query = query.where(PatientDiagnosisModel.patient_id == patient_id)
+
     if diagnosis_id is not None:
-        query = query.filter(PatientDiagnosisModel.diagnosis_id == diagnosis_id)
-    
-    patient_diagnoses = query.offset(skip).limit(limit).all()
-    return patient_diagnoses
+        query = query.where(PatientDiagnosisModel.diagnosis_id == diagnosis_id)
+
+    rows = (await db.execute(query.offset(skip).limit(limit))).mappings().all()
+    # model_construct skips re-validation; the rows come straight from our
+    # own schema and already have the right types
+    return [PatientDiagnosis.model_construct(**row) for row in rows]
 
 
 @router.get("/patient-diagnoses/{patient_diagnosis_id}", response_model=PatientDiagnosis)
-def read_patient_diagnosis(patient_diagnosis_id: int, db: Session = Depends(get_db)):
+async def read_patient_diagnosis(
+    patient_diagnosis: PatientDiagnosisModel = Depends(get_patient_diagnosis_or_404)
+):
     """
     Retrieve a specific patient diagnosis by ID.
     """
-    patient_diagnosis = db.query(PatientDiagnosisModel).filter(PatientDiagnosisModel.id == patient_diagnosis_id).first()
-    if patient_diagnosis is None:
-        raise HTTPException(status_code=404, detail="Patient diagnosis not found")
     return patient_diagnosis
 
 
 # Patient Procedures endpoints
 @router.post("/patient-procedures/", response_model=PatientProcedure)
-def create_patient_procedure(patient_procedure: PatientProcedureCreate, db: Session = Depends(get_db)):
+async def create_patient_procedure(patient_procedure: PatientProcedureCreate, db: AsyncSession = Depends(get_db)):
     """
     Create a new patient procedure.
     """
-    db_patient_procedure = PatientProcedureModel(
-        patient_id=patient_procedure.patient_id,
-        cpt_code_id=patient_procedure.cpt_code_id,
-        diagnosis_id=patient_procedure.diagnosis_id,
-        ordered_date=patient_procedure.ordered_date,
-        priority=patient_procedure.priority,
-        notes=patient_procedure.notes
-    )
-    db.add(db_patient_procedure)
-    db.commit()
-    db.refresh(db_patient_procedure)
+    db_patient_procedure = (await db.execute(
+        insert(PatientProcedureModel)
+        .values(**patient_procedure.model_dump())
+        .returning(PatientProcedureModel)
+    )).scalar_one()
+    await db.commit()
+    cache.invalidate_snapshots()
     return db_patient_procedure
 
 
 @router.get("/patient-procedures/", response_model=List[PatientProcedure])
-def read_patient_procedures(
-    skip: int = 0, 
-    limit: int = 100, 
+async def read_patient_procedures(
+    skip: int = 0,
+    limit: int = 100,
     patient_id: Optional[int] = Query(None, description="Filter by patient ID"),
     cpt_code_id: Optional[int] = Query(None, description="Filter by CPT code ID"),
     diagnosis_id: Optional[int] = Query(None, description="Filter by diagnosis ID"),
     priority: Optional[int] = Query(None, description="Filter by priority level"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Retrieve patient procedures with optional filtering.
     """
-    query = db.query(PatientProcedureModel)
-    
+    # Select plain column rows — the list path never mutates these
+    # objects, so skip ORM instrumentation entirely
+    query = select(PatientProcedureModel.__table__)
+
     if patient_id is not None:
-        query = query.filter(PatientProcedureModel.patient_id == patient_id)
-    
+        query = query.where(PatientProcedureModel.patient_id == patient_id)
+
     if cpt_code_id is not None:
-        query = query.filter(PatientProcedureModel.cpt_code_id == cpt_code_id)
-    
+        query = query.where(PatientProcedureModel.cpt_code_id == cpt_code_id)
+
     if diagnosis_id is not None:
-        query = query.filter(PatientProcedureModel.diagnosis_id == diagnosis_id)
-    
+        query = query.where(PatientProcedureModel.diagnosis_id == diagnosis_id)
+
     if priority is not None:
-        query = query.filter(PatientProcedureModel.priority == priority)
-    
-    patient_procedures = query.offset(skip).limit(limit).all()
-    return patient_procedures
+        query = query.where(PatientProcedureModel.priority == priority)
+
+    rows = (await db.execute(query.offset(skip).limit(limit))).mappings().all()
+    # model_construct skips re-validation; the rows come straight from our
+    # own schema and already have the right types
+    return [PatientProcedure.model_construct(**row) for row in rows]
 
 
 @router.get("/patient-procedures/{patient_procedure_id}", response_model=PatientProcedure)
-def read_patient_procedure(patient_procedure_id: int, db: Session = Depends(get_db)):
+async def read_patient_procedure(
+    patient_procedure: PatientProcedureModel = Depends(get_patient_procedure_or_404)
+):
     """
     Retrieve a specific patient procedure by ID.
     """
-    patient_procedure = db.query(PatientProcedureModel).filter(PatientProcedureModel.id == patient_procedure_id).first()
-    if patient_procedure is None:
-        raise HTTPException(status_code=404, detail="Patient procedure not found")
-    return patient_procedure
\ No newline at end of file
+    return patient_procedure
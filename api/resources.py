@@ -1,195 +1,229 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.deps import get_or_404
 from database.database import get_db
 from database.models import Resource as ResourceModel, TimeSlot as TimeSlotModel
 from models.scheduling import Resource, ResourceCreate, TimeSlot, TimeSlotCreate
+from services import cache
+from utils.http_cache import etag_cache
 
 router = APIRouter(
     prefix="/resources",
     tags=["resources"],
     responses={404: {"description": "Not found"}},
+    default_response_class=ORJSONResponse,
 )
 
 
+# Shared load-or-404 dependencies; each underlying SELECT is built once
+get_resource_or_404 = get_or_404(ResourceModel, "resource_id", "Resource not found")
+get_time_slot_or_404 = get_or_404(TimeSlotModel, "time_slot_id", "Time slot not found")
+
+
+async def _resource_exists(db: AsyncSession, resource_id: int) -> bool:
+    """Check that a resource exists without hydrating the full row."""
+    return (await db.execute(
+        select(1).where(ResourceModel.id == resource_id).limit(1)
+    )).scalar() is not None
+
+
 @router.post("/", response_model=Resource)
-def create_resource(resource: ResourceCreate, db: Session = Depends(get_db)):
+async def create_resource(resource: ResourceCreate, db: AsyncSession = Depends(get_db)):
     """
     Create a new resource (room, equipment, etc.).
     """
-    db_resource = ResourceModel(
-        name=resource.name,
-        type=resource.type,
-        is_available=resource.is_available
-    )
-    db.add(db_resource)
-    db.commit()
-    db.refresh(db_resource)
+    # INSERT ... RETURNING gives back the persisted row in one round-trip,
+    # avoiding the extra SELECT a refresh() would issue
+    db_resource = (await db.execute(
+        insert(ResourceModel).values(**resource.model_dump()).returning(ResourceModel)
+    )).scalar_one()
+    await db.commit()
+    cache.invalidate("resources")
     return db_resource
 
 
 @router.get("/", response_model=List[Resource])
-def read_resources(
-    skip: int = 0, 
-    limit: int = 100, 
+@etag_cache(ttl=60)
+async def read_resources(
+    skip: int = 0,
+    limit: int = 100,
     type: Optional[str] = Query(None, description="Filter by resource type"),
     available: Optional[bool] = Query(None, description="Filter by availability"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Retrieve resources with optional filtering.
     """
-    query = db.query(ResourceModel)
-    
+    # Select plain column rows — the list path never mutates these
+    # objects, so skip ORM instrumentation entirely
+    query = select(ResourceModel.__table__)
+
     if type:
-        query = query.filter(ResourceModel.type == type)
-    
+        query = query.where(ResourceModel.type == type)
+
     if available is not None:
-        query = query.filter(ResourceModel.is_available == available)
-    
-    resources = query.offset(skip).limit(limit).all()
-    return resources
+        query = query.where(ResourceModel.is_available == available)
+
+    rows = (await db.execute(query.offset(skip).limit(limit))).mappings().all()
+    # model_construct skips re-validation; the rows come straight from our
+    # own schema and already have the right types
+    return [Resource.model_construct(**row) for row in rows]
 
 
 @router.get("/{resource_id}", response_model=Resource)
-def read_resource(resource_id: int, db: Session = Depends(get_db)):
+async def read_resource(resource: ResourceModel = Depends(get_resource_or_404)):
     """
     Retrieve a specific resource by ID.
     """
-    resource = db.query(ResourceModel).filter(ResourceModel.id == resource_id).first()
-    if resource is None:
-        raise HTTPException(status_code=404, detail="Resource not found")
     return resource
 
 
 @router.put("/{resource_id}", response_model=Resource)
-def update_resource(resource_id: int, resource: ResourceCreate, db: Session = Depends(get_db)):
+async def update_resource(
+    resource: ResourceCreate,
+    db_resource: ResourceModel = Depends(get_resource_or_404),
+    db: AsyncSession = Depends(get_db)
+):
     """
     Update a resource's information.
     """
-    db_resource = db.query(ResourceModel).filter(ResourceModel.id == resource_id).first()
-    if db_resource is None:
-        raise HTTPException(status_code=404, detail="Resource not found")
-    
     db_resource.name = resource.name
     db_resource.type = resource.type
     db_resource.is_available = resource.is_available
-    
-    db.commit()
-    db.refresh(db_resource)
+
+    await db.commit()
+    await db.refresh(db_resource)
+    cache.invalidate("resources")
     return db_resource
 
 
 @router.delete("/{resource_id}", response_model=dict)
-def delete_resource(resource_id: int, db: Session = Depends(get_db)):
+async def delete_resource(
+    resource_id: int,
+    db_resource: ResourceModel = Depends(get_resource_or_404),
+    db: AsyncSession = Depends(get_db)
+):
     """
     Delete a resource.
     """
-    db_resource = db.query(ResourceModel).filter(ResourceModel.id == resource_id).first()
-    if db_resource is None:
-        raise HTTPException(status_code=404, detail="Resource not found")
-    
-    db.delete(db_resource)
-    db.commit()
+    await db.delete(db_resource)
+    await db.commit()
+    cache.invalidate("resources")
     return {"message": f"Resource {resource_id} deleted successfully"}
 
 
 # Time Slots endpoints
 @router.post("/{resource_id}/time-slots/", response_model=TimeSlot)
-def create_time_slot(
-    resource_id: int, 
-    time_slot: TimeSlotCreate, 
-    db: Session = Depends(get_db)
+async def create_time_slot(
+    resource_id: int,
+    time_slot: TimeSlotCreate,
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Create a new time slot for a specific resource.
     """
     # Check if resource exists
-    resource = db.query(ResourceModel).filter(ResourceModel.id == resource_id).first()
-    if resource is None:
+    if not await _resource_exists(db, resource_id):
         raise HTTPException(status_code=404, detail="Resource not found")
-    
-    # Create time slot
-    db_time_slot = TimeSlotModel(
-        resource_id=resource_id,
-        date=time_slot.date,
-        start_time=time_slot.start_time,
-        end_time=time_slot.end_time,
-        is_available=time_slot.is_available
-    )
-    db.add(db_time_slot)
-    db.commit()
-    db.refresh(db_time_slot)
+
+    # Create time slot in one INSERT ... RETURNING round-trip; the unique
+    # constraint on (resource, date, start, end) turns a duplicate into a
+    # client error rather than a second copy of the slot
+    try:
+        db_time_slot = (await db.execute(
+            insert(TimeSlotModel)
+            .values(**{**time_slot.model_dump(), "resource_id": resource_id})
+            .returning(TimeSlotModel)
+        )).scalar_one()
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail="A time slot with this resource, date and time already exists")
+    cache.invalidate_snapshots()
     return db_time_slot
 
 
 @router.get("/{resource_id}/time-slots/", response_model=List[TimeSlot])
-def read_time_slots(
+async def read_time_slots(
     resource_id: int,
-    skip: int = 0, 
-    limit: int = 100, 
+    skip: int = 0,
+    limit: int = 100,
     available: Optional[bool] = Query(None, description="Filter by availability"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Retrieve time slots for a specific resource with optional filtering.
     """
     # Check if resource exists
-    resource = db.query(ResourceModel).filter(ResourceModel.id == resource_id).first()
-    if resource is None:
+    if not await _resource_exists(db, resource_id):
         raise HTTPException(status_code=404, detail="Resource not found")
-    
+
     # Query time slots
-    query = db.query(TimeSlotModel).filter(TimeSlotModel.resource_id == resource_id)
-    
+    # Select plain column rows — the list path never mutates these
+    # objects, so skip ORM instrumentation entirely
+    query = select(TimeSlotModel.__table__).where(TimeSlotModel.resource_id == resource_id)
+
     if available is not None:
-        query = query.filter(TimeSlotModel.is_available == available)
-    
-    time_slots = query.offset(skip).limit(limit).all()
-    return time_slots
+        query = query.where(TimeSlotModel.is_available == available)
+
+    rows = (await db.execute(query.offset(skip).limit(limit))).mappings().all()
+    # model_construct skips re-validation; the rows come straight from our
+    # own schema and already have the right types
+    return [TimeSlot.model_construct(**row) for row in rows]
 
 
 @router.get("/time-slots/{time_slot_id}", response_model=TimeSlot)
-def read_time_slot(time_slot_id: int, db: Session = Depends(get_db)):
+async def read_time_slot(time_slot: TimeSlotModel = Depends(get_time_slot_or_404)):
     """
     Retrieve a specific time slot by ID.
     """
-    time_slot = db.query(TimeSlotModel).filter(TimeSlotModel.id == time_slot_id).first()
-    if time_slot is None:
-        raise HTTPException(status_code=404, detail="Time slot not found")
     return time_slot
 
 
 @router.put("/time-slots/{time_slot_id}", response_model=TimeSlot)
-def update_time_slot(time_slot_id: int, time_slot: TimeSlotCreate, db: Session = Depends(get_db)):
+async def update_time_slot(
+    time_slot: TimeSlotCreate,
+    db_time_slot: TimeSlotModel = Depends(get_time_slot_or_404),
+    db: AsyncSession = Depends(get_db)
+):
     """
     Update a time slot's information.
     """
-    db_time_slot = db.query(TimeSlotModel).filter(TimeSlotModel.id == time_slot_id).first()
-    if db_time_slot is None:
-        raise HTTPException(status_code=404, detail="Time slot not found")
-    
     db_time_slot.resource_id = time_slot.resource_id
     db_time_slot.date = time_slot.date
     db_time_slot.start_time = time_slot.start_time
     db_time_slot.end_time = time_slot.end_time
     db_time_slot.is_available = time_slot.is_available
-    
-    db.commit()
-    db.refresh(db_time_slot)
+
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail="A time slot with this resource, date and time already exists")
+    await db.refresh(db_time_slot)
+    cache.invalidate_snapshots()
     return db_time_slot
 
 
 @router.delete("/time-slots/{time_slot_id}", response_model=dict)
-def delete_time_slot(time_slot_id: int, db: Session = Depends(get_db)):
+async def delete_time_slot(
+    time_slot_id: int,
+    db_time_slot: TimeSlotModel = Depends(get_time_slot_or_404),
+    db: AsyncSession = Depends(get_db)
+):
     """
     Delete a time slot.
     """
-    db_time_slot = db.query(TimeSlotModel).filter(TimeSlotModel.id == time_slot_id).first()
-    if db_time_slot is None:
-        raise HTTPException(status_code=404, detail="Time slot not found")
-    
-    db.delete(db_time_slot)
-    db.commit()
-    return {"message": f"Time slot {time_slot_id} deleted successfully"}
\ No newline at end of file
+    await db.delete(db_time_slot)
+    await db.commit()
+    cache.invalidate_snapshots()
+    return {"message": f"Time slot {time_slot_id} deleted successfully"}
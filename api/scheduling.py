@@ -1,188 +1,254 @@
+import asyncio
+import hashlib
 from typing import List, Optional
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
+import orjson
+from sqlalchemy import insert, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from database.database import get_db
+from api.deps import get_or_404
+from database.database import SessionLocal, get_db
 from database.models import (
     Appointment as AppointmentModel,
-    Patient as PatientModel,
     PatientProcedure as PatientProcedureModel,
-    Diagnosis as DiagnosisModel,
-    CPTCode as CPTCodeModel,
-    TimeSlot as TimeSlotModel,
-    Resource as ResourceModel
+    TimeSlot as TimeSlotModel
 )
 from models.scheduling import (
-    Appointment, ScheduleRequest, ScheduleResponse
+    Appointment, ScheduleRequest, ScheduleResponse, appointment_list_adapter
 )
+from services import cache
 from services.scheduler import SchedulingService
 
 router = APIRouter(
     prefix="/scheduling",
     tags=["scheduling"],
     responses={404: {"description": "Not found"}},
+    default_response_class=ORJSONResponse,
 )
 
 
-@router.post("/optimize/", response_model=ScheduleResponse)
-def optimize_schedule(
+# Shared load-or-404 dependency; the underlying SELECT is built once
+get_appointment_or_404 = get_or_404(
+    AppointmentModel, "appointment_id", "Appointment not found")
+
+
+@router.post("/optimize/", response_model=ScheduleResponse,
+             response_model_exclude_none=True)
+async def optimize_schedule(
     request: ScheduleRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Optimize the schedule based on the provided parameters.
-    
+
     This endpoint uses machine learning to create an optimal schedule for patient procedures.
     """
-    # Get all required data from the database
-    procedures_query = db.query(PatientProcedureModel)
-    
-    # Apply filters from the request
-    if request.patient_ids:
-        procedures_query = procedures_query.filter(PatientProcedureModel.patient_id.in_(request.patient_ids))
-    
-    if request.procedure_ids:
-        procedures_query = procedures_query.filter(PatientProcedureModel.id.in_(request.procedure_ids))
-    
-    procedures = procedures_query.all()
-    
-    if not procedures:
-        return ScheduleResponse(
-            appointments=[],
-            unscheduled_procedures=[],
-            optimization_score=0.0,
-            message="No procedures found matching the criteria"
+    # Repeat calls with an identical request (common while a client
+    # iterates on a window) reuse the full input snapshot and skip every
+    # SELECT below; writes to the underlying tables drop the snapshots
+    snapshot_key = hashlib.blake2b(
+        orjson.dumps(request.model_dump(), default=str), digest_size=16
+    ).hexdigest()
+    snapshot = cache.get_snapshot(snapshot_key)
+
+    if snapshot is not None:
+        procedures, cpt_codes, time_slots, resources = snapshot
+    else:
+        # Get all required data from the database; the scheduler only
+        # reads the procedures' own columns, never their relationships
+        procedures_query = select(PatientProcedureModel)
+
+        # Apply filters from the request
+        if request.patient_ids:
+            procedures_query = procedures_query.where(PatientProcedureModel.patient_id.in_(request.patient_ids))
+
+        if request.procedure_ids:
+            procedures_query = procedures_query.where(PatientProcedureModel.id.in_(request.procedure_ids))
+
+        procedures = (await db.execute(procedures_query)).scalars().all()
+
+        if not procedures:
+            return ScheduleResponse(
+                appointments=[],
+                unscheduled_procedures=[],
+                optimization_score=0.0,
+                message="No procedures found matching the criteria"
+            )
+
+        # Get the CPT codes, time slots, and resources the scheduler
+        # actually consumes. The queries are independent, so run them
+        # concurrently on separate sessions instead of paying serial
+        # round-trips.
+        async def fetch_all(stmt):
+            async with SessionLocal() as session:
+                return (await session.execute(stmt)).scalars().all()
+
+        # CPT codes and resources change rarely, so they come from the
+        # TTL lookup cache rather than a fresh full-table scan each call
+        async def fetch_cached(loader):
+            async with SessionLocal() as session:
+                return await loader(session)
+
+        cpt_codes, time_slots, resources = await asyncio.gather(
+            fetch_cached(cache.get_all_cpt_codes),
+            # Filter time slots by date range and availability
+            fetch_all(
+                select(TimeSlotModel).where(
+                    TimeSlotModel.date >= request.start_date,
+                    TimeSlotModel.date <= request.end_date,
+                    TimeSlotModel.is_available == True
+                )
+            ),
+            fetch_cached(cache.get_all_resources),
         )
-    
-    # Get all patients, diagnoses, CPT codes, time slots, and resources
-    patients = db.query(PatientModel).all()
-    diagnoses = db.query(DiagnosisModel).all()
-    cpt_codes = db.query(CPTCodeModel).all()
-    
-    # Filter time slots by date range and availability
-    time_slots = db.query(TimeSlotModel).filter(
-        TimeSlotModel.date >= request.start_date,
-        TimeSlotModel.date <= request.end_date,
-        TimeSlotModel.is_available == True
-    ).all()
-    
-    resources = db.query(ResourceModel).all()
-    
-    # Create scheduling service
-    scheduling_service = SchedulingService()
-    
+
+        cache.put_snapshot(
+            snapshot_key,
+            (procedures, cpt_codes, time_slots, resources),
+        )
+
+    # Create scheduling service; the catalogs become id lookups once here
+    scheduling_service = SchedulingService(
+        cpt_codes=cpt_codes,
+        resources=resources,
+    )
+
     # Optimize schedule
     schedule_response = scheduling_service.optimize_schedule(
         procedures=procedures,
-        patients=patients,
-        diagnoses=diagnoses,
-        cpt_codes=cpt_codes,
         time_slots=time_slots,
-        resources=resources,
         request=request
     )
-    
-    # Save appointments to database
-    for appointment in schedule_response.appointments:
-        db_appointment = AppointmentModel(
-            patient_id=appointment.patient_id,
-            procedure_id=appointment.procedure_id,
-            resource_id=appointment.resource_id,
-            scheduled_date=appointment.scheduled_date,
-            start_time=appointment.start_time,
-            end_time=appointment.end_time,
-            status=appointment.status,
-            notes=appointment.notes
+
+    # Save appointments and release their time slots in two bulk statements
+    # instead of one INSERT and one SELECT/UPDATE round-trip per appointment.
+    # On Postgres the executemany insert goes through asyncpg's batched
+    # prepared-statement path, so all rows ride a single pipelined exchange
+    if schedule_response.appointments:
+        appointment_rows = [
+            {
+                "patient_id": appointment.patient_id,
+                "procedure_id": appointment.procedure_id,
+                "resource_id": appointment.resource_id,
+                "scheduled_date": appointment.scheduled_date,
+                "start_time": appointment.start_time,
+                "end_time": appointment.end_time,
+                "status": appointment.status,
+                "notes": appointment.notes,
+            }
+            for appointment in schedule_response.appointments
+        ]
+        await db.execute(insert(AppointmentModel), appointment_rows)
+
+        # Mark the booked time slots as unavailable
+        slot_keys = [
+            (appointment.resource_id, appointment.scheduled_date,
+             appointment.start_time, appointment.end_time)
+            for appointment in schedule_response.appointments
+        ]
+        await db.execute(
+            update(TimeSlotModel)
+            .where(
+                tuple_(
+                    TimeSlotModel.resource_id,
+                    TimeSlotModel.date,
+                    TimeSlotModel.start_time,
+                    TimeSlotModel.end_time,
+                ).in_(slot_keys)
+            )
+            .values(is_available=False)
         )
-        db.add(db_appointment)
-    
-    # Update time slots to mark them as unavailable
-    for appointment in schedule_response.appointments:
-        time_slot = db.query(TimeSlotModel).filter(
-            TimeSlotModel.resource_id == appointment.resource_id,
-            TimeSlotModel.date == appointment.scheduled_date,
-            TimeSlotModel.start_time == appointment.start_time,
-            TimeSlotModel.end_time == appointment.end_time
-        ).first()
-        
-        if time_slot:
-            time_slot.is_available = False
-    
-    db.commit()
-    
+
+    await db.commit()
+
+    if schedule_response.appointments:
+        # The booked slots are gone; cached snapshots are no longer valid
+        cache.invalidate_snapshots()
+
     return schedule_response
 
 
 @router.get("/appointments/", response_model=List[Appointment])
-def read_appointments(
-    skip: int = 0, 
-    limit: int = 100, 
+async def read_appointments(
+    skip: int = 0,
+    limit: int = 100,
     patient_id: Optional[int] = Query(None, description="Filter by patient ID"),
     resource_id: Optional[int] = Query(None, description="Filter by resource ID"),
     start_date: Optional[datetime] = Query(None, description="Filter by start date"),
     end_date: Optional[datetime] = Query(None, description="Filter by end date"),
     status: Optional[str] = Query(None, description="Filter by status"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Retrieve appointments with optional filtering.
     """
-    query = db.query(AppointmentModel)
-    
+    # Collect the active filters and apply them in one .where() call, so
+    # only one statement is constructed per filter-shape and SQLAlchemy's
+    # compiled-SQL cache hits across requests with the same filter set
+    conds = []
+
     if patient_id is not None:
-        query = query.filter(AppointmentModel.patient_id == patient_id)
-    
+        conds.append(AppointmentModel.patient_id == patient_id)
+
     if resource_id is not None:
-        query = query.filter(AppointmentModel.resource_id == resource_id)
-    
+        conds.append(AppointmentModel.resource_id == resource_id)
+
     if start_date is not None:
-        query = query.filter(AppointmentModel.scheduled_date >= start_date)
-    
+        conds.append(AppointmentModel.scheduled_date >= start_date)
+
     if end_date is not None:
-        query = query.filter(AppointmentModel.scheduled_date <= end_date)
-    
+        conds.append(AppointmentModel.scheduled_date <= end_date)
+
     if status:
-        query = query.filter(AppointmentModel.status == status)
-    
-    appointments = query.offset(skip).limit(limit).all()
-    return appointments
+        conds.append(AppointmentModel.status == status)
+
+    # Select plain column rows — the list path never mutates these
+    # objects, so skip ORM instrumentation entirely
+    query = select(AppointmentModel.__table__).where(*conds)
+
+    rows = (await db.execute(query.offset(skip).limit(limit))).mappings().all()
+    # model_construct skips re-validation (the rows come straight from our
+    # own schema), and the precompiled adapter serializes the whole list
+    # in one pydantic-core pass; returning a Response bypasses FastAPI's
+    # per-request re-validation against the response_model
+    appointments = [Appointment.model_construct(**row) for row in rows]
+    return ORJSONResponse(appointment_list_adapter.dump_python(appointments, mode="json"))
 
 
 @router.get("/appointments/{appointment_id}", response_model=Appointment)
-def read_appointment(appointment_id: int, db: Session = Depends(get_db)):
+async def read_appointment(appointment: AppointmentModel = Depends(get_appointment_or_404)):
     """
     Retrieve a specific appointment by ID.
     """
-    appointment = db.query(AppointmentModel).filter(AppointmentModel.id == appointment_id).first()
-    if appointment is None:
-        raise HTTPException(status_code=404, detail="Appointment not found")
     return appointment
 
 
 @router.put("/appointments/{appointment_id}/cancel", response_model=Appointment)
-def cancel_appointment(appointment_id: int, db: Session = Depends(get_db)):
+async def cancel_appointment(
+    appointment: AppointmentModel = Depends(get_appointment_or_404),
+    db: AsyncSession = Depends(get_db)
+):
     """
     Cancel an appointment.
     """
-    appointment = db.query(AppointmentModel).filter(AppointmentModel.id == appointment_id).first()
-    if appointment is None:
-        raise HTTPException(status_code=404, detail="Appointment not found")
-    
     # Update appointment status
     appointment.status = "cancelled"
-    
+
     # Make the time slot available again
-    time_slot = db.query(TimeSlotModel).filter(
-        TimeSlotModel.resource_id == appointment.resource_id,
-        TimeSlotModel.date == appointment.scheduled_date,
-        TimeSlotModel.start_time == appointment.start_time,
-        TimeSlotModel.end_time == appointment.end_time
-    ).first()
-    
+    time_slot = (await db.execute(
+        select(TimeSlotModel).where(
+            TimeSlotModel.resource_id == appointment.resource_id,
+            TimeSlotModel.date == appointment.scheduled_date,
+            TimeSlotModel.start_time == appointment.start_time,
+            TimeSlotModel.end_time == appointment.end_time
+        )
+    )).scalars().first()
+
     if time_slot:
         time_slot.is_available = True
-    
-    db.commit()
-    db.refresh(appointment)
-    return appointment
\ No newline at end of file
+
+    await db.commit()
+    await db.refresh(appointment)
+    return appointment
@@ -1,149 +1,208 @@
 from datetime import datetime, time
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Date, Time, ForeignKey, Float, Text
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from typing import List, Optional
 
-Base = declarative_base()
+from sqlalchemy import DDL, Enum, ForeignKey, Index, SmallInteger, String, Text, Time, UniqueConstraint, event, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql import func
+
+from database.database import Base
+
+# Low-cardinality string columns as real enums: narrower rows, better
+# index selectivity, and the DB rejects typos
+GenderEnum = Enum("Male", "Female", "Other", name="gender")
+AppointmentStatusEnum = Enum("scheduled", "completed", "cancelled",
+                             name="appointment_status")
+ResourceTypeEnum = Enum("Exam Room", "Procedure Room", "X-Ray Room", "Lab",
+                        "EKG Room", "Consultation Room", name="resource_type")
 
 
 class Patient(Base):
     """SQLAlchemy model for patients."""
     __tablename__ = "patients"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    first_name = Column(String, nullable=False)
-    last_name = Column(String, nullable=False)
-    date_of_birth = Column(DateTime, nullable=False)
-    gender = Column(String, nullable=False)
-    phone_number = Column(String, nullable=False)
-    email = Column(String, nullable=True)
-    address = Column(String, nullable=True)
-    insurance_provider = Column(String, nullable=True)
-    insurance_id = Column(String, nullable=True)
-    created_at = Column(DateTime, default=datetime.now)
-    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
-    
+    __table_args__ = (
+        # Trigram GIN indexes let Postgres serve the leading-wildcard
+        # ILIKE name filter in read_patients from an index instead of a
+        # sequential scan; other dialects fall back to plain indexes
+        Index("ix_patients_first_name_trgm", "first_name",
+              postgresql_using="gin", postgresql_ops={"first_name": "gin_trgm_ops"}),
+        Index("ix_patients_last_name_trgm", "last_name",
+              postgresql_using="gin", postgresql_ops={"last_name": "gin_trgm_ops"}),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    first_name: Mapped[str]
+    last_name: Mapped[str]
+    date_of_birth: Mapped[datetime]
+    gender: Mapped[str] = mapped_column(GenderEnum)
+    # Faker-style numbers with extensions run past 20 characters, so cap
+    # at 32 rather than the conventional 20
+    phone_number: Mapped[str] = mapped_column(String(32))
+    email: Mapped[Optional[str]]
+    address: Mapped[Optional[str]]
+    insurance_provider: Mapped[Optional[str]]
+    insurance_id: Mapped[Optional[str]]
+    created_at: Mapped[Optional[datetime]] = mapped_column(server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        server_default=func.now(), onupdate=datetime.now)
+
     # Relationships
-    diagnoses = relationship("PatientDiagnosis", back_populates="patient")
-    procedures = relationship("PatientProcedure", back_populates="patient")
-    appointments = relationship("Appointment", back_populates="patient")
+    diagnoses: Mapped[List["PatientDiagnosis"]] = relationship(back_populates="patient")
+    procedures: Mapped[List["PatientProcedure"]] = relationship(back_populates="patient")
+    appointments: Mapped[List["Appointment"]] = relationship(back_populates="patient")
 
 
 class Diagnosis(Base):
     """SQLAlchemy model for diagnoses."""
     __tablename__ = "diagnoses"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    icd_code = Column(String, nullable=False, index=True)
-    description = Column(String, nullable=False)
-    severity = Column(Integer, nullable=False)
-    created_at = Column(DateTime, default=datetime.now)
-    
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    icd_code: Mapped[str] = mapped_column(String(10), index=True)
+    description: Mapped[str]
+    severity: Mapped[int] = mapped_column(SmallInteger)
+    created_at: Mapped[Optional[datetime]] = mapped_column(server_default=func.now())
+
     # Relationships
-    patient_diagnoses = relationship("PatientDiagnosis", back_populates="diagnosis")
+    patient_diagnoses: Mapped[List["PatientDiagnosis"]] = relationship(
+        back_populates="diagnosis")
 
 
 class CPTCode(Base):
     """SQLAlchemy model for CPT codes."""
     __tablename__ = "cpt_codes"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    code = Column(String, nullable=False, index=True)
-    description = Column(String, nullable=False)
-    duration_minutes = Column(Integer, nullable=False)
-    requires_specialist = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.now)
-    
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    code: Mapped[str] = mapped_column(String(10), index=True)
+    description: Mapped[str]
+    duration_minutes: Mapped[int]
+    requires_specialist: Mapped[Optional[bool]] = mapped_column(default=False)
+    created_at: Mapped[Optional[datetime]] = mapped_column(server_default=func.now())
+
     # Relationships
-    patient_procedures = relationship("PatientProcedure", back_populates="cpt_code")
+    patient_procedures: Mapped[List["PatientProcedure"]] = relationship(
+        back_populates="cpt_code")
 
 
 class PatientDiagnosis(Base):
     """SQLAlchemy model for patient diagnoses."""
     __tablename__ = "patient_diagnoses"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    patient_id = Column(Integer, ForeignKey("patients.id"), nullable=False)
-    diagnosis_id = Column(Integer, ForeignKey("diagnoses.id"), nullable=False)
-    diagnosed_date = Column(DateTime, nullable=False)
-    notes = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.now)
-    
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    patient_id: Mapped[int] = mapped_column(ForeignKey("patients.id"))
+    diagnosis_id: Mapped[int] = mapped_column(ForeignKey("diagnoses.id"))
+    diagnosed_date: Mapped[datetime]
+    notes: Mapped[Optional[str]] = mapped_column(Text)
+    created_at: Mapped[Optional[datetime]] = mapped_column(server_default=func.now())
+
     # Relationships
-    patient = relationship("Patient", back_populates="diagnoses")
-    diagnosis = relationship("Diagnosis", back_populates="patient_diagnoses")
+    patient: Mapped["Patient"] = relationship(back_populates="diagnoses")
+    diagnosis: Mapped["Diagnosis"] = relationship(back_populates="patient_diagnoses")
 
 
 class PatientProcedure(Base):
     """SQLAlchemy model for patient procedures."""
     __tablename__ = "patient_procedures"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    patient_id = Column(Integer, ForeignKey("patients.id"), nullable=False)
-    cpt_code_id = Column(Integer, ForeignKey("cpt_codes.id"), nullable=False)
-    diagnosis_id = Column(Integer, ForeignKey("diagnoses.id"), nullable=True)
-    ordered_date = Column(DateTime, nullable=False)
-    priority = Column(Integer, default=3)
-    notes = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.now)
-    
-    # Relationships
-    patient = relationship("Patient", back_populates="procedures")
-    cpt_code = relationship("CPTCode", back_populates="patient_procedures")
-    diagnosis = relationship("Diagnosis")
-    appointments = relationship("Appointment", back_populates="procedure")
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    patient_id: Mapped[int] = mapped_column(ForeignKey("patients.id"))
+    cpt_code_id: Mapped[int] = mapped_column(ForeignKey("cpt_codes.id"))
+    diagnosis_id: Mapped[Optional[int]] = mapped_column(ForeignKey("diagnoses.id"))
+    ordered_date: Mapped[datetime]
+    priority: Mapped[Optional[int]] = mapped_column(SmallInteger, default=3)
+    notes: Mapped[Optional[str]] = mapped_column(Text)
+    created_at: Mapped[Optional[datetime]] = mapped_column(server_default=func.now())
+
+    # Relationships. The scheduler reads procedures column-wise and
+    # resolves CPT codes through the cached catalog, so nothing traverses
+    # these per-row — keep them lazy.
+    patient: Mapped["Patient"] = relationship(back_populates="procedures")
+    cpt_code: Mapped["CPTCode"] = relationship(back_populates="patient_procedures")
+    diagnosis: Mapped[Optional["Diagnosis"]] = relationship()
+    appointments: Mapped[List["Appointment"]] = relationship(
+        back_populates="procedure")
 
 
 class Resource(Base):
     """SQLAlchemy model for resources."""
     __tablename__ = "resources"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, nullable=False)
-    type = Column(String, nullable=False)
-    is_available = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.now)
-    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
-    
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    name: Mapped[str]
+    type: Mapped[str] = mapped_column(ResourceTypeEnum)
+    is_available: Mapped[Optional[bool]] = mapped_column(default=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        server_default=func.now(), onupdate=datetime.now)
+
     # Relationships
-    time_slots = relationship("TimeSlot", back_populates="resource")
-    appointments = relationship("Appointment", back_populates="resource")
+    time_slots: Mapped[List["TimeSlot"]] = relationship(back_populates="resource")
+    appointments: Mapped[List["Appointment"]] = relationship(back_populates="resource")
 
 
 class TimeSlot(Base):
     """SQLAlchemy model for time slots."""
     __tablename__ = "time_slots"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    resource_id = Column(Integer, ForeignKey("resources.id"), nullable=False)
-    date = Column(DateTime, nullable=False)
-    start_time = Column(Time, nullable=False)
-    end_time = Column(Time, nullable=False)
-    is_available = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.now)
-    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
-    
+    __table_args__ = (
+        # The scheduler and cancellation path probe slots by this exact
+        # 4-tuple; the composite index turns that into a single index scan
+        # and the unique constraint rules out duplicate slots per resource
+        Index("ix_time_slots_lookup", "resource_id", "date", "start_time", "end_time"),
+        UniqueConstraint("resource_id", "date", "start_time", "end_time",
+                         name="uq_time_slots_resource_date_start_end"),
+        # Postgres-only partial index: the optimizer only ever asks for
+        # free slots, so index just those rows
+        Index("ix_time_slots_free", "resource_id", "date",
+              postgresql_where=text("is_available")),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    resource_id: Mapped[int] = mapped_column(ForeignKey("resources.id"))
+    date: Mapped[datetime]
+    start_time: Mapped[time]
+    end_time: Mapped[time]
+    is_available: Mapped[Optional[bool]] = mapped_column(default=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        server_default=func.now(), onupdate=datetime.now)
+
     # Relationships
-    resource = relationship("Resource", back_populates="time_slots")
+    resource: Mapped["Resource"] = relationship(back_populates="time_slots")
 
 
 class Appointment(Base):
     """SQLAlchemy model for appointments."""
     __tablename__ = "appointments"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    patient_id = Column(Integer, ForeignKey("patients.id"), nullable=False)
-    procedure_id = Column(Integer, ForeignKey("patient_procedures.id"), nullable=False)
-    resource_id = Column(Integer, ForeignKey("resources.id"), nullable=False)
-    scheduled_date = Column(DateTime, nullable=False)
-    start_time = Column(Time, nullable=False)
-    end_time = Column(Time, nullable=False)
-    status = Column(String, default="scheduled")
-    notes = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.now)
-    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
-    
+    __table_args__ = (
+        # read_appointments filters by patient and scheduled date range
+        Index("ix_appointments_patient_scheduled", "patient_id", "scheduled_date"),
+        # Resource-schedule lookups (conflict checks, per-room agendas)
+        # filter by resource, day and start time
+        Index("ix_appointments_resource_date_start",
+              "resource_id", "scheduled_date", "start_time"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    patient_id: Mapped[int] = mapped_column(ForeignKey("patients.id"))
+    procedure_id: Mapped[int] = mapped_column(ForeignKey("patient_procedures.id"))
+    resource_id: Mapped[int] = mapped_column(ForeignKey("resources.id"))
+    scheduled_date: Mapped[datetime]
+    start_time: Mapped[time]
+    end_time: Mapped[time]
+    status: Mapped[Optional[str]] = mapped_column(
+        AppointmentStatusEnum, default="scheduled")
+    notes: Mapped[Optional[str]] = mapped_column(Text)
+    created_at: Mapped[Optional[datetime]] = mapped_column(server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        server_default=func.now(), onupdate=datetime.now)
+
     # Relationships
-    patient = relationship("Patient", back_populates="appointments")
-    procedure = relationship("PatientProcedure", back_populates="appointments")
-    resource = relationship("Resource", back_populates="appointments")
\ No newline at end of file
+    patient: Mapped["Patient"] = relationship(back_populates="appointments")
+    procedure: Mapped["PatientProcedure"] = relationship(back_populates="appointments")
+    resource: Mapped["Resource"] = relationship(back_populates="appointments")
+
+# The trigram indexes above need the pg_trgm extension; create it ahead of
+# the tables when running on Postgres
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
@@ -1,10 +1,12 @@
 from datetime import datetime
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Diagnosis(BaseModel):
     """Model for medical diagnoses."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Unique identifier for the diagnosis")
     icd_code: str = Field(..., description="ICD-10 code for the diagnosis")
     description: str = Field(..., description="Description of the diagnosis")
@@ -21,6 +23,8 @@ class DiagnosisCreate(BaseModel):
 
 class CPTCode(BaseModel):
     """Model for CPT (Current Procedural Terminology) codes."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Unique identifier for the CPT code")
     code: str = Field(..., description="CPT code")
     description: str = Field(..., description="Description of the procedure")
@@ -39,6 +43,8 @@ class CPTCodeCreate(BaseModel):
 
 class PatientDiagnosis(BaseModel):
     """Model for linking patients with diagnoses."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Unique identifier for the patient diagnosis")
     patient_id: int = Field(..., description="ID of the patient")
     diagnosis_id: int = Field(..., description="ID of the diagnosis")
@@ -57,6 +63,8 @@ class PatientDiagnosisCreate(BaseModel):
 
 class PatientProcedure(BaseModel):
     """Model for linking patients with procedures (CPT codes)."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Unique identifier for the patient procedure")
     patient_id: int = Field(..., description="ID of the patient")
     cpt_code_id: int = Field(..., description="ID of the CPT code")
@@ -73,5 +81,5 @@ class PatientProcedureCreate(BaseModel):
     cpt_code_id: int
     diagnosis_id: Optional[int] = None
     ordered_date: datetime
-    priority: int = 3
+    priority: int = Field(default=3, ge=1, le=5)
     notes: Optional[str] = None
\ No newline at end of file
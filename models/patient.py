@@ -1,6 +1,10 @@
 from datetime import datetime
-from typing import List, Optional
-from pydantic import BaseModel, Field, EmailStr
+from typing import List, Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
+
+# Mirrors the gender enum in database/models.py; only Postgres enforces
+# the enum at the column level, so validate here for every dialect
+Gender = Literal["Male", "Female", "Other"]
 
 
 class PatientBase(BaseModel):
@@ -8,8 +12,8 @@ class PatientBase(BaseModel):
     first_name: str
     last_name: str
     date_of_birth: datetime
-    gender: str = Field(..., description="Patient's gender (Male, Female, Other)")
-    phone_number: str
+    gender: Gender = Field(..., description="Patient's gender (Male, Female, Other)")
+    phone_number: str = Field(..., max_length=32)
     email: Optional[str] = None
     address: Optional[str] = None
     insurance_provider: Optional[str] = None
@@ -18,6 +22,8 @@ class PatientBase(BaseModel):
 
 class Patient(PatientBase):
     """Patient model with ID."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Unique identifier for the patient")
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
@@ -33,8 +39,8 @@ class PatientUpdate(BaseModel):
     first_name: Optional[str] = None
     last_name: Optional[str] = None
     date_of_birth: Optional[datetime] = None
-    gender: Optional[str] = None
-    phone_number: Optional[str] = None
+    gender: Optional[Gender] = None
+    phone_number: Optional[str] = Field(None, max_length=32)
     email: Optional[str] = None
     address: Optional[str] = None
     insurance_provider: Optional[str] = None
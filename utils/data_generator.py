@@ -1,11 +1,9 @@
 from datetime import datetime, time, timedelta
 import random
 from typing import List, Dict, Any, Optional
-from faker import Faker
 
-from models.patient import PatientCreate
-from models.medical import DiagnosisCreate, CPTCodeCreate, PatientDiagnosisCreate, PatientProcedureCreate
-from models.scheduling import ResourceCreate, TimeSlotCreate
+import numpy as np
+from faker import Faker
 
 fake = Faker()
 
@@ -58,136 +56,142 @@ RESOURCE_TYPES = [
 ]
 
 
-def generate_patients(count: int = 50) -> List[PatientCreate]:
-    """Generate a list of fake patients."""
-    patients = []
-    for _ in range(count):
-        gender = random.choice(["Male", "Female", "Other"])
-        first_name = fake.first_name_male() if gender == "Male" else fake.first_name_female()
-        
-        patient = PatientCreate(
-            first_name=first_name,
-            last_name=fake.last_name(),
-            date_of_birth=fake.date_of_birth(minimum_age=18, maximum_age=90),
-            gender=gender,
-            phone_number=fake.phone_number(),
-            email=fake.email(),
-            address=fake.address(),
-            insurance_provider=fake.company(),
-            insurance_id=fake.uuid4()
-        )
-        patients.append(patient)
-    
-    return patients
-
-
-def generate_diagnoses() -> List[DiagnosisCreate]:
+def generate_patients(count: int = 50) -> List[Dict[str, Any]]:
+    """
+    Generate fake patients as plain dict rows.
+
+    The columns are built one at a time (SoA) and zipped into row dicts
+    at the end, so seeding never touches per-object attribute access or
+    model wrappers on its way to the bulk INSERT.
+    """
+    genders = random.choices(["Male", "Female", "Other"], k=count)
+    columns = {
+        "first_name": [
+            fake.first_name_male() if g == "Male" else fake.first_name_female()
+            for g in genders
+        ],
+        "last_name": [fake.last_name() for _ in range(count)],
+        "date_of_birth": [
+            datetime.combine(fake.date_of_birth(minimum_age=18, maximum_age=90), time(0, 0))
+            for _ in range(count)
+        ],
+        "gender": genders,
+        "phone_number": [fake.phone_number() for _ in range(count)],
+        "email": [fake.email() for _ in range(count)],
+        "address": [fake.address() for _ in range(count)],
+        "insurance_provider": [fake.company() for _ in range(count)],
+        "insurance_id": [fake.uuid4() for _ in range(count)],
+    }
+    return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+
+def generate_diagnoses() -> List[Dict[str, Any]]:
     """Generate a list of diagnoses from the sample data."""
-    return [DiagnosisCreate(**diagnosis) for diagnosis in SAMPLE_DIAGNOSES]
+    return [dict(diagnosis) for diagnosis in SAMPLE_DIAGNOSES]
 
 
-def generate_cpt_codes() -> List[CPTCodeCreate]:
+def generate_cpt_codes() -> List[Dict[str, Any]]:
     """Generate a list of CPT codes from the sample data."""
-    return [CPTCodeCreate(**cpt_code) for cpt_code in SAMPLE_CPT_CODES]
+    return [dict(cpt_code) for cpt_code in SAMPLE_CPT_CODES]
 
 
-def generate_patient_diagnoses(patient_count: int, diagnosis_count: int) -> List[PatientDiagnosisCreate]:
+def generate_patient_diagnoses(patient_count: int, diagnosis_count: int) -> List[Dict[str, Any]]:
     """Generate patient diagnoses by randomly assigning diagnoses to patients."""
     patient_diagnoses = []
-    
+
     for patient_id in range(1, patient_count + 1):
         # Each patient gets 1-3 diagnoses
         num_diagnoses = random.randint(1, 3)
         diagnosis_ids = random.sample(range(1, diagnosis_count + 1), num_diagnoses)
-        
+
         for diagnosis_id in diagnosis_ids:
-            patient_diagnosis = PatientDiagnosisCreate(
-                patient_id=patient_id,
-                diagnosis_id=diagnosis_id,
-                diagnosed_date=fake.date_time_between(start_date="-1y", end_date="now"),
-                notes=fake.text(max_nb_chars=100) if random.random() > 0.7 else None
-            )
-            patient_diagnoses.append(patient_diagnosis)
-    
+            patient_diagnoses.append({
+                "patient_id": patient_id,
+                "diagnosis_id": diagnosis_id,
+                "diagnosed_date": fake.date_time_between(start_date="-1y", end_date="now"),
+                "notes": fake.text(max_nb_chars=100) if random.random() > 0.7 else None,
+            })
+
     return patient_diagnoses
 
 
-def generate_patient_procedures(patient_diagnoses: List[PatientDiagnosisCreate], cpt_code_count: int) -> List[PatientProcedureCreate]:
+def generate_patient_procedures(patient_diagnoses: List[Dict[str, Any]], cpt_code_count: int) -> List[Dict[str, Any]]:
     """Generate patient procedures based on their diagnoses."""
     patient_procedures = []
-    
+
     for pd in patient_diagnoses:
         # Each diagnosis may lead to 0-2 procedures
         num_procedures = random.randint(0, 2)
-        
+
         for _ in range(num_procedures):
-            cpt_code_id = random.randint(1, cpt_code_count)
-            priority = random.randint(1, 5)
-            
-            patient_procedure = PatientProcedureCreate(
-                patient_id=pd.patient_id,
-                cpt_code_id=cpt_code_id,
-                diagnosis_id=pd.diagnosis_id,
-                ordered_date=pd.diagnosed_date + timedelta(days=random.randint(1, 14)),
-                priority=priority,
-                notes=fake.text(max_nb_chars=100) if random.random() > 0.7 else None
-            )
-            patient_procedures.append(patient_procedure)
-    
+            patient_procedures.append({
+                "patient_id": pd["patient_id"],
+                "cpt_code_id": random.randint(1, cpt_code_count),
+                "diagnosis_id": pd["diagnosis_id"],
+                "ordered_date": pd["diagnosed_date"] + timedelta(days=random.randint(1, 14)),
+                "priority": random.randint(1, 5),
+                "notes": fake.text(max_nb_chars=100) if random.random() > 0.7 else None,
+            })
+
     return patient_procedures
 
 
-def generate_resources(count: int = 10) -> List[ResourceCreate]:
+def generate_resources(count: int = 10) -> List[Dict[str, Any]]:
     """Generate a list of resources for the outpatient setting."""
-    resources = []
-    
-    for i in range(count):
-        resource_type = random.choice(RESOURCE_TYPES)
-        resource = ResourceCreate(
-            name=f"{resource_type} {i+1}",
-            type=resource_type,
-            is_available=random.random() > 0.1  # 90% of resources are available
-        )
-        resources.append(resource)
-    
-    return resources
-
-
-def generate_time_slots(resource_count: int, days_ahead: int = 30) -> List[TimeSlotCreate]:
-    """Generate available time slots for resources."""
-    time_slots = []
-    
-    # Generate time slots for the next 'days_ahead' days
-    for day in range(days_ahead):
-        current_date = datetime.now().date() + timedelta(days=day)
-        
-        # Skip weekends
-        if current_date.weekday() >= 5:  # 5 = Saturday, 6 = Sunday
-            continue
-        
-        for resource_id in range(1, resource_count + 1):
-            # Generate slots from 8 AM to 5 PM in 30-minute increments
-            start_hour = 8
-            end_hour = 17
-            
-            for hour in range(start_hour, end_hour):
-                for minute in [0, 30]:
-                    start_time = time(hour, minute)
-                    end_time = time(hour, minute + 30) if minute == 0 else time(hour + 1, 0)
-                    
-                    # Convert date to datetime for the model
-                    slot_date = datetime.combine(current_date, time(0, 0))
-                    
-                    time_slot = TimeSlotCreate(
-                        resource_id=resource_id,
-                        date=slot_date,
-                        start_time=start_time,
-                        end_time=end_time,
-                        is_available=random.random() > 0.2  # 80% of slots are available
-                    )
-                    time_slots.append(time_slot)
-    
-    return time_slots
+    # One batched draw per column instead of two random calls per row
+    types = random.choices(RESOURCE_TYPES, k=count)
+    available = np.random.random(count) > 0.1  # 90% of resources are available
+
+    return [
+        {
+            "name": f"{resource_type} {i+1}",
+            "type": resource_type,
+            "is_available": bool(is_available),
+        }
+        for i, (resource_type, is_available) in enumerate(zip(types, available))
+    ]
+
+
+def generate_time_slots(resource_count: int, days_ahead: int = 30) -> List[Dict[str, Any]]:
+    """
+    Generate available time slots for resources as plain dict rows.
+
+    This table dominates seed time (resources x weekdays x 18 slots), so
+    the date/resource/slot cross product is built with NumPy instead of
+    three nested Python loops. The rows feed the bulk INSERT in
+    database/seed.py directly, without model wrappers.
+    """
+    # Weekdays among the next 'days_ahead' days
+    dates64 = np.datetime64(datetime.now().date()) + np.arange(days_ahead)
+    dates64 = dates64[np.is_busday(dates64)]
+
+    # Slots from 8 AM to 5 PM in 30-minute increments, as time objects
+    # shared by every (date, resource) pair
+    start_minutes = 8 * 60 + np.arange(18) * 30
+    starts = [time(int(m) // 60, int(m) % 60) for m in start_minutes]
+    ends = [time(int(m) // 60, int(m) % 60) for m in start_minutes + 30]
+
+    # Dates as datetimes for the model, one object per distinct day
+    dates = [datetime.combine(d.item(), time(0, 0)) for d in dates64]
+
+    # Full cross product in SoA form: date varies slowest, then resource,
+    # then slot index
+    n_slots = len(starts)
+    date_idx = np.repeat(np.arange(len(dates)), resource_count * n_slots)
+    resource_ids = np.tile(np.repeat(np.arange(1, resource_count + 1), n_slots), len(dates))
+    slot_idx = np.tile(np.arange(n_slots), len(dates) * resource_count)
+    available = np.random.random(date_idx.size) > 0.2  # 80% of slots are available
+
+    return [
+        {
+            "resource_id": int(r),
+            "date": dates[d],
+            "start_time": starts[s],
+            "end_time": ends[s],
+            "is_available": bool(a),
+        }
+        for d, r, s, a in zip(date_idx, resource_ids, slot_idx, available)
+    ]
 
 
 def generate_all_data(
@@ -0,0 +1,56 @@
+import functools
+import hashlib
+import inspect
+
+import orjson
+from fastapi import Request, Response
+
+
+def _jsonable(obj):
+    """orjson fallback for Pydantic models in the response payload."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    raise TypeError(f"Cannot serialize {type(obj)!r}")
+
+
+def etag_cache(ttl: int = 60):
+    """
+    Decorator for read-only endpoints returning slowly-changing data.
+
+    Computes an ETag over the serialized payload and emits Cache-Control
+    headers so clients and proxies can revalidate with a 304 instead of
+    re-running the whole DB path.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            request: Request = kwargs.pop("__etag_request")
+            response: Response = kwargs.pop("__etag_response")
+
+            result = await func(*args, **kwargs)
+
+            body = orjson.dumps(result, default=_jsonable)
+            etag = '"{}"'.format(hashlib.blake2b(body, digest_size=16).hexdigest())
+            headers = {
+                "ETag": etag,
+                "Cache-Control": f"max-age={ttl}, stale-while-revalidate=300",
+            }
+
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers=headers)
+
+            response.headers.update(headers)
+            return result
+
+        # FastAPI resolves dependencies from the signature, so expose two
+        # extra keyword-only parameters for the request/response objects
+        sig = inspect.signature(func)
+        params = list(sig.parameters.values())
+        params.append(inspect.Parameter(
+            "__etag_request", inspect.Parameter.KEYWORD_ONLY, annotation=Request))
+        params.append(inspect.Parameter(
+            "__etag_response", inspect.Parameter.KEYWORD_ONLY, annotation=Response))
+        wrapper.__signature__ = sig.replace(parameters=params)
+        return wrapper
+
+    return decorator